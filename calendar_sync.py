@@ -1,39 +1,341 @@
 import os
+import re
 import json
-import pickle
+import base64
+import hashlib
 import logging
-import requests
-from datetime import datetime, timedelta
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import Error as GoogleAPIError
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 import tkinter as tk
 from tkinter import ttk, messagebox
-import keyring
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 class GoogleAPIError(Exception):
     """Custom exception for Google API related errors."""
     pass
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('calendar_sync.log'),
-        logging.StreamHandler()
-    ]
-)
+class SyncCancelledError(Exception):
+    """Raised when the user cancels a running synchronization."""
+    pass
+
+# Configure logging. Records are written to the file and console by a
+# listener thread, so logging calls on the sync thread do not wait for I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('calendar_sync.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.Queue(-1)
+log_listener = QueueListener(_log_queue, *_log_handlers)
+log_listener.start()
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Selenium, the Google and Microsoft client libraries, requests and keyring are
+# imported inside the methods that use them, so the window opens without
+# waiting for them to load.
+
+# Microsoft Graph endpoints and limits
+GRAPH_API_URL = 'https://graph.microsoft.com/v1.0'
+GRAPH_EVENTS_PATH = '/me/events'  # Batch sub-requests use URLs relative to GRAPH_API_URL
+GRAPH_DELTA_URL = GRAPH_API_URL + '/me/calendarView/delta'
+GRAPH_BATCH_URL = GRAPH_API_URL + '/$batch'
+GRAPH_BATCH_LIMIT = 20  # Maximum number of requests Graph accepts per JSON batch
+GRAPH_MAX_RETRIES = 5
+# The O365 delta listing covers this many days from its first request, so its
+# delta link stays usable while the sync window moves forward (days)
+GRAPH_DELTA_WINDOW_DAYS = 90
+# Ask Graph for IDs that stay stable when events move between folders, and
+# skip echoing the written event back in responses to writes
+GRAPH_READ_PREFER = 'outlook.timezone="UTC", IdType="ImmutableId"'
+GRAPH_WRITE_PREFER = 'return=minimal, IdType="ImmutableId"'
+# Outlook allows only a handful of concurrent requests per mailbox, so keep
+# the number of in-flight Graph calls small to avoid being throttled.
+GRAPH_MAX_WORKERS = 4
+# Outlook allows 10,000 requests per mailbox every 10 minutes; stay just
+# below that average rate. Each request inside a batch counts separately.
+GRAPH_REQUESTS_PER_SECOND = 15
+
+# Delegated Graph permissions requested through MSAL
+GRAPH_SCOPES = ['Calendars.ReadWrite']
+
+# Cached access tokens are reused until they are this close to expiry (seconds)
+TOKEN_MIN_TTL = 300
+# Time allowed for completing the DUO prompt after signing in (seconds)
+O365_LOGIN_TIMEOUT = 120
+# Time allowed for filling in the O365 sign-in form (seconds)
+O365_FORM_TIMEOUT = 30
+# Interval between checks of the page state through DevTools (seconds)
+BROWSER_POLL_INTERVAL = 0.05
+
+# Reads the Outlook web access token from local storage
+ACCESS_TOKEN_SCRIPT = 'window.localStorage.getItem("accessToken")'
+
+# Reports the outcome of a sign-in: the access token once Outlook has stored
+# it, or the message shown when Microsoft rejects the email or password
+O365_LOGIN_STATE_SCRIPT = """(() => {
+    const error = document.querySelector('#usernameError, #passwordError');
+    if (error && error.offsetParent !== null) {
+        return {error: error.textContent.trim()};
+    }
+    const token = window.localStorage.getItem("accessToken");
+    return token ? {token: token} : null;
+})()"""
+
+# Fills in the Microsoft sign-in form inside the page. DOM changes are watched
+# with a MutationObserver so each step runs as soon as its input is shown,
+# without a WebDriver round trip per element. Calls back with null on success
+# or an error message.
+O365_LOGIN_SCRIPT = """
+const [email, password, done] = arguments;
+
+function waitFor(selector) {
+    return new Promise(resolve => {
+        const find = () => {
+            const element = document.querySelector(selector);
+            return element && element.offsetParent !== null && !element.disabled ? element : null;
+        };
+        const found = find();
+        if (found) {
+            return resolve(found);
+        }
+        const observer = new MutationObserver(() => {
+            const element = find();
+            if (element) {
+                observer.disconnect();
+                resolve(element);
+            }
+        });
+        observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    });
+}
+
+function fill(input, value) {
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+
+(async () => {
+    fill(await waitFor('input[name=loginfmt]'), email);
+    (await waitFor('#idSIButton9')).click();
+    fill(await waitFor('input[name=passwd]'), password);
+    (await waitFor('#idSIButton9')).click();
+    done(null);
+})().catch(error => done(String(error)));
+"""
+
+
+def json_dumps(obj):
+    """
+    Serialize an object to JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def json_loads(data):
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        data (bytes or str): JSON document
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def token_expiry(token):
+    """
+    Read the expiry time from a JWT access token.
+
+    Args:
+        token (str): Encoded JWT access token
+
+    Returns:
+        int: Expiry as a Unix timestamp, or 0 if it cannot be determined
+    """
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return int(json_loads(base64.urlsafe_b64decode(payload)).get('exp', 0))
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return 0
+
+
+def normalize_datetime(value):
+    """
+    Convert an ISO 8601 date or timestamp to a naive UTC string.
+
+    Google returns timestamps with a UTC offset while Graph returns naive UTC
+    values with seven fractional digits, so both are normalized before they
+    are compared.
+
+    Args:
+        value (str): ISO 8601 date or timestamp
+
+    Returns:
+        str: Timestamp formatted as YYYY-MM-DDTHH:MM:SS, or the input unchanged
+            if it cannot be parsed
+    """
+    try:
+        parsed = datetime.fromisoformat(re.sub(r'\.\d+', '', value).replace('Z', '+00:00'))
+    except (TypeError, ValueError):
+        return value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat(timespec='seconds')
+
+
+def utc_timestamp(moment):
+    """
+    Format an aware datetime as an ISO 8601 UTC timestamp with a Z suffix.
+
+    Args:
+        moment (datetime): Timezone-aware datetime
+
+    Returns:
+        str: Timestamp such as 2024-01-31T09:00:00Z
+    """
+    return moment.astimezone(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+
+def retry_after_seconds(value, default):
+    """
+    Read the delay from a Retry-After header.
+
+    Args:
+        value (str): Header value, or None if the header is missing
+        default (int): Delay to use when the value is missing or not a number
+            of seconds, for example an HTTP date
+
+    Returns:
+        int: Delay in seconds
+    """
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def event_in_window(event, time_min, time_max):
+    """
+    Check whether a Google or O365 event overlaps the sync window.
+
+    This applies the same rule as the timeMin and timeMax listing parameters:
+    the event must end after time_min and start before time_max.
+
+    Args:
+        event (dict): Google or O365 event data
+        time_min (str): Start of the sync window as an ISO 8601 UTC timestamp
+        time_max (str): End of the sync window as an ISO 8601 UTC timestamp
+
+    Returns:
+        bool: True if the event falls at least partly inside the window
+    """
+    start = event.get('start') or {}
+    end = event.get('end') or {}
+    start_time = normalize_datetime(start.get('dateTime') or start.get('date'))
+    end_time = normalize_datetime(end.get('dateTime') or end.get('date'))
+    if not start_time or not end_time:
+        return False
+    return end_time > normalize_datetime(time_min) and start_time < normalize_datetime(time_max)
+
+
+def event_id_from_location(location):
+    """
+    Extract the event ID from the Location header of a Graph create response.
+
+    Args:
+        location (str): Location header value, e.g. .../Users('...')/Events('AAMk...')
+
+    Returns:
+        str: Event ID, or None if the header does not contain one
+    """
+    match = re.search(r"Events\('([^']+)'\)", location or '', re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def chunked(iterable, size):
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Args:
+        iterable: Items to split
+        size (int): Maximum chunk size
+
+    Yields:
+        list: The next chunk of items
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how fast requests are sent.
+
+    Tokens are added at a fixed rate up to the bucket capacity. A caller that
+    takes more tokens than are available sleeps until the shortfall has been
+    refilled, so bursts are allowed but the average rate stays bounded.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum number of tokens the bucket holds
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, count=1):
+        """
+        Take tokens from the bucket, waiting until they have been refilled.
+
+        Args:
+            count (int): Number of tokens to take
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the tokens now so concurrent callers queue up behind this one
+            self._tokens -= count
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
 class CalendarSync:
     """
     A class to synchronize events between Google Calendar and Office 365 Calendar.
@@ -44,58 +346,119 @@ class CalendarSync:
     Office 365.
     """
 
+    SCOPES = ('https://www.googleapis.com/auth/calendar.readonly',)
+
     def __init__(self):
         """Initialize the CalendarSync application with necessary configurations."""
-        self.SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
         self.credentials_dir = 'credentials'
         self.config_file = 'config.json'
+        self._config = None
+        self._driver = None
+        self._google_service = None
+        self._google_creds = None
+        self._sync_thread = None
+        self._o365_username = ''
+        self._o365_password = ''
+        self._msal_app = None
+        self._msal_cache = None
+        self._saved_credentials = None
+        self._token_cache = {}
+        self._o365_cookies = None
+        self._cancel_event = threading.Event()
+        self._graph_throttle = TokenBucket(GRAPH_REQUESTS_PER_SECOND, GRAPH_BATCH_LIMIT)
+
+    def load_config(self):
+        """
+        Load settings from the config file.
         
-        # Ensure credentials directory exists
-        if not os.path.exists(self.credentials_dir):
-            os.makedirs(self.credentials_dir)
-            logger.info("Created credentials directory")
+        The file is only read on first use; later calls return the cached values.
+        
+        Returns:
+            dict: Settings from config.json, empty if it is missing or invalid
+        """
+        if self._config is None:
+            self._config = {}
+            try:
+                with open(self.config_file, 'rb') as f:
+                    self._config = json_loads(f.read())
+                logger.info("Configuration loaded successfully")
+            except FileNotFoundError:
+                pass
+            except json.JSONDecodeError:
+                logger.error("Error reading config file")
+        return self._config
 
-        # Load configuration if exists
-        self.load_config()
+    @property
+    def o365_client_id(self):
+        """str: Client ID of the Azure app registration used with MSAL, if any."""
+        return self.load_config().get('o365_client_id', '')
 
-    def load_config(self):
-        """Load configuration from config file if it exists."""
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.gmail_email_default = config.get('gmail_email', '')
-                    self.o365_email_default = config.get('o365_email', '')
-                    logger.info("Configuration loaded successfully")
-            else:
-                self.gmail_email_default = ''
-                self.o365_email_default = ''
-                logger.warning("No configuration file found")
-        except json.JSONDecodeError:
-            logger.error("Error reading config file")
-            self.gmail_email_default = ''
-            self.o365_email_default = ''
+    @property
+    def o365_tenant(self):
+        """str: Azure AD tenant used for MSAL sign-ins."""
+        return self.load_config().get('o365_tenant', '') or 'common'
+
+    def load_saved_credentials(self):
+        """
+        Load the account names stored by save_credentials from the keyring.
+        
+        Addresses missing from the keyring, or all of them when no keyring is
+        available, are taken from the gmail_email and o365_email settings that
+        older versions kept in config.json. Addresses found there are moved into
+        the keyring when possible. The keyring is only queried once; later calls
+        return the cached values.
+        
+        Returns:
+            tuple: (gmail_email, o365_email), empty strings if nothing was saved
+        """
+        if self._saved_credentials is None:
+            import keyring
+
+            credentials = []
+            for name in ('gmail_email', 'o365_email'):
+                try:
+                    value = keyring.get_password("calendar_sync", name)
+                except Exception as e:
+                    # No usable keyring backend, so only config.json can be read
+                    logger.warning(f"Could not read {name} from the keyring: {str(e)}")
+                    credentials.append(self.load_config().get(name) or '')
+                    continue
+
+                if value is None:
+                    value = self.load_config().get(name) or ''
+                    if value:
+                        try:
+                            keyring.set_password("calendar_sync", name, value)
+                            logger.info(f"Moved {name} from config.json to the keyring")
+                        except Exception as e:
+                            logger.warning(f"Could not move {name} to the keyring: {str(e)}")
+                credentials.append(value)
+            self._saved_credentials = tuple(credentials)
+            logger.info("Saved credentials loaded successfully")
+        return self._saved_credentials
 
     def setup_gui(self):
         """Set up the graphical user interface."""
         self.root = tk.Tk()
         self.root.title("Calendar Sync")
-        self.root.geometry("400x300")
+        self.root.geometry("400x350")
 
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+        gmail_email, o365_email = self.load_saved_credentials()
+
         # Gmail account
         ttk.Label(main_frame, text="Gmail Account:").grid(row=0, column=0, sticky=tk.W)
         self.gmail_email = ttk.Entry(main_frame, width=40)
         self.gmail_email.grid(row=0, column=1, pady=5)
-        self.gmail_email.insert(0, self.gmail_email_default)
+        self.gmail_email.insert(0, gmail_email)
 
         # O365 account
         ttk.Label(main_frame, text="O365 Account:").grid(row=1, column=0, sticky=tk.W)
         self.o365_email = ttk.Entry(main_frame, width=40)
         self.o365_email.grid(row=1, column=1, pady=5)
-        self.o365_email.insert(0, self.o365_email_default)
+        self.o365_email.insert(0, o365_email)
         
         # O365 password
         ttk.Label(main_frame, text="O365 Password:").grid(row=2, column=0, sticky=tk.W)
@@ -103,12 +466,18 @@ class CalendarSync:
         self.o365_password.grid(row=2, column=1, pady=5)
 
         # Buttons
-        ttk.Button(main_frame, text="Start Sync", command=self.start_sync).grid(row=3, column=1, pady=20)
+        self.start_button = ttk.Button(main_frame, text="Start Sync", command=self.start_sync)
+        self.start_button.grid(row=3, column=1, pady=20)
+        ttk.Button(main_frame, text="Cancel", command=self.cancel_sync).grid(row=3, column=0, pady=20)
         ttk.Button(main_frame, text="Save Credentials", command=self.save_credentials).grid(row=4, column=1)
 
+        # Progress indicator
+        self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.progress.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(20, 0))
+
         # Status label
         self.status_label = ttk.Label(main_frame, text="")
-        self.status_label.grid(row=5, column=0, columnspan=2, pady=20)
+        self.status_label.grid(row=6, column=0, columnspan=2, pady=20)
 
     def authenticate_google(self):
         """
@@ -121,16 +490,24 @@ class CalendarSync:
             FileNotFoundError: If client_secrets.json is missing
             GoogleAPIError: If authentication fails
         """
+        # Reuse the service built by a previous sync while its credentials are valid
+        if self._google_service is not None and self._google_creds_fresh(self._google_creds):
+            return self._google_service
+
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+
         try:
-            creds = None
-            token_path = os.path.join(self.credentials_dir, 'gmail_token.pickle')
+            creds = self._google_creds
+            token_path = os.path.join(self.credentials_dir, 'gmail_token.json')
             
-            if os.path.exists(token_path):
-                with open(token_path, 'rb') as token:
-                    creds = pickle.load(token)
+            if creds is None and os.path.exists(token_path):
+                creds = Credentials.from_authorized_user_file(token_path, self.SCOPES)
 
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
+            if not creds or not self._google_creds_fresh(creds):
+                if creds and creds.refresh_token:
                     creds.refresh(Request())
                 else:
                     client_secrets_path = os.path.join(self.credentials_dir, 'client_secrets.json')
@@ -144,11 +521,19 @@ class CalendarSync:
                         client_secrets_path, self.SCOPES)
                     creds = flow.run_local_server(port=0)
 
-                with open(token_path, 'wb') as token:
-                    pickle.dump(creds, token)
+                os.makedirs(self.credentials_dir, exist_ok=True)
+                with open(token_path, 'w') as token:
+                    token.write(creds.to_json())
+                os.chmod(token_path, 0o600)
 
             logger.info("Google authentication successful")
-            return build('calendar', 'v3', credentials=creds)
+            # Use the discovery document bundled with the client instead of fetching it
+            self._google_service = build(
+                'calendar', 'v3', credentials=creds,
+                static_discovery=True, cache_discovery=False
+            )
+            self._google_creds = creds
+            return self._google_service
             
         except FileNotFoundError as e:
             logger.error(f"Authentication failed: {str(e)}")
@@ -157,288 +542,1125 @@ class CalendarSync:
             logger.error(f"Unexpected error during Google authentication: {str(e)}")
             raise GoogleAPIError(f"Google authentication failed: {str(e)}")
 
+    def _google_creds_fresh(self, creds):
+        """
+        Check whether Google credentials are valid and not about to expire.
+        
+        Args:
+            creds (google.oauth2.credentials.Credentials): Credentials to check
+            
+        Returns:
+            bool: True if the credentials can be used without refreshing them
+        """
+        if not creds.valid:
+            return False
+        if creds.expiry is None:
+            return True
+        # google-auth stores the expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (creds.expiry - now).total_seconds() > TOKEN_MIN_TTL
+
+    def _make_driver(self):
+        """
+        Create a headless Chrome WebDriver using a persistent profile.
+        
+        The profile keeps cookies and local storage between runs, so repeated
+        logins can skip the DUO prompt.
+        
+        Returns:
+            selenium.webdriver.Chrome: New WebDriver instance
+        """
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless=new')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        profile_dir = os.path.abspath(os.path.join(self.credentials_dir, 'chrome_profile'))
+        options.add_argument(f'--user-data-dir={profile_dir}')
+        return webdriver.Chrome(options=options)
+
+    def _get_driver(self):
+        """
+        Return the shared WebDriver, starting Chrome on first use.
+        
+        Returns:
+            selenium.webdriver.Chrome: Running WebDriver instance
+        """
+        if self._driver is None:
+            self._driver = self._make_driver()
+        return self._driver
+
+    def _quit_driver(self):
+        """Shut down the shared WebDriver if it is running."""
+        if self._driver is not None:
+            from selenium.common.exceptions import WebDriverException
+
+            try:
+                self._driver.quit()
+            except WebDriverException as e:
+                logger.warning(f"Error closing browser: {str(e)}")
+            self._driver = None
+
+    def _wait_for_script(self, driver, expression, timeout):
+        """
+        Poll a JavaScript expression in the page until it returns a truthy value.
+        
+        The expression is evaluated with the Chrome DevTools Runtime.evaluate
+        command every BROWSER_POLL_INTERVAL seconds. This reacts faster than
+        WebDriverWait's default half-second polling.
+        
+        Args:
+            driver (selenium.webdriver.Chrome): Running WebDriver instance
+            expression (str): JavaScript expression to evaluate
+            timeout (float): Maximum time to wait in seconds
+            
+        Returns:
+            The first truthy value returned by the expression
+            
+        Raises:
+            TimeoutException: If the expression is still falsy after the timeout
+        """
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                result = driver.execute_cdp_cmd(
+                    'Runtime.evaluate', {'expression': expression, 'returnByValue': True}
+                )
+                value = result.get('result', {}).get('value')
+                if value:
+                    return value
+            except WebDriverException:
+                # The page is navigating and has no execution context yet
+                pass
+
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Timed out waiting for {expression}")
+            time.sleep(BROWSER_POLL_INTERVAL)
+
+    def _get_msal_app(self):
+        """
+        Return the MSAL client application, creating it on first use.
+        
+        The token cache is restored from credentials/msal_cache.bin so refresh
+        tokens from earlier runs are reused.
+        
+        Returns:
+            msal.PublicClientApplication: Client for the configured app registration
+        """
+        if self._msal_app is None:
+            import msal
+
+            self._msal_cache = msal.SerializableTokenCache()
+            cache_path = os.path.join(self.credentials_dir, 'msal_cache.bin')
+            if os.path.exists(cache_path):
+                with open(cache_path, 'r') as f:
+                    self._msal_cache.deserialize(f.read())
+
+            self._msal_app = msal.PublicClientApplication(
+                self.o365_client_id,
+                authority=f'https://login.microsoftonline.com/{self.o365_tenant}',
+                token_cache=self._msal_cache
+            )
+        return self._msal_app
+
+    def _save_msal_cache(self):
+        """Persist the MSAL token cache if it has changed."""
+        if self._msal_cache is not None and self._msal_cache.has_state_changed:
+            os.makedirs(self.credentials_dir, exist_ok=True)
+            cache_path = os.path.join(self.credentials_dir, 'msal_cache.bin')
+            with open(cache_path, 'w') as f:
+                f.write(self._msal_cache.serialize())
+            os.chmod(cache_path, 0o600)
+
+    def _acquire_msal_token(self, interactive=False):
+        """
+        Obtain a Graph access token through MSAL.
+        
+        A cached or refreshed token is used when possible. Otherwise, if
+        interactive is True, the entered password is tried first, and the user
+        signs in through the system browser if that fails, for example because
+        the account requires MFA.
+        
+        Args:
+            interactive (bool): Whether to fall back to an interactive sign-in
+            
+        Returns:
+            str: Access token, or None if no token could be obtained
+        """
+        app = self._get_msal_app()
+        result = None
+
+        accounts = app.get_accounts(username=self._o365_username or None)
+        if accounts:
+            result = app.acquire_token_silent(GRAPH_SCOPES, account=accounts[0])
+        if not result and interactive and self._o365_username and self._o365_password:
+            result = app.acquire_token_by_username_password(
+                self._o365_username, self._o365_password, scopes=GRAPH_SCOPES
+            )
+            if 'access_token' not in result:
+                logger.warning(
+                    "Password sign-in failed, falling back to interactive sign-in: "
+                    f"{result.get('error_description', result.get('error'))}"
+                )
+                result = None
+        if not result and interactive:
+            result = app.acquire_token_interactive(GRAPH_SCOPES, login_hint=self._o365_username or None)
+        self._save_msal_cache()
+
+        if result and 'access_token' in result:
+            return result['access_token']
+        if result:
+            logger.error(f"MSAL token request failed: {result.get('error_description', result.get('error'))}")
+        return None
+
     def authenticate_o365(self):
         """
-        Authenticate with Office 365 using Selenium.
+        Authenticate with Office 365.
+        
+        When an Azure AD client ID is configured the token is obtained with MSAL;
+        otherwise the Outlook web login is automated with Selenium.
         
         Returns:
             bool: True if authentication successful, False otherwise
         """
-        driver = None
+        if self.o365_client_id:
+            try:
+                if self._acquire_msal_token(interactive=True):
+                    logger.info("O365 authentication successful")
+                    return True
+                self._show_error("O365 authentication failed. See the log for details.")
+            except Exception as e:
+                logger.error(f"Unexpected error during O365 authentication: {str(e)}")
+                self._show_error(f"O365 authentication failed: {str(e)}")
+            return False
+
+        from selenium.common.exceptions import ScriptTimeoutException, TimeoutException, WebDriverException
+
         try:
-            driver = webdriver.Chrome()
+            driver = self._get_driver()
             logger.info("Starting O365 authentication")
             
             # Navigate to O365 login
             driver.get('https://outlook.office365.com/calendar/view/month')
             
-            # Wait for and fill email
-            email_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "loginfmt"))
-            )
-            email_input.send_keys(self.o365_email.get())
+            # Fill in the sign-in form unless the browser profile is still signed in
+            if 'login.microsoftonline.com' in driver.current_url:
+                driver.set_script_timeout(O365_FORM_TIMEOUT)
+                error = driver.execute_async_script(
+                    O365_LOGIN_SCRIPT, self._o365_username, self._o365_password
+                )
+                if error:
+                    raise Exception(f"Could not complete sign-in form: {error}")
             
-            # Click Next
-            next_button = driver.find_element(By.ID, "idSIButton9")
-            next_button.click()
-            
-            # Wait for and fill password
-            password_input = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.NAME, "passwd"))
-            )
-            time.sleep(1)
-            driver.execute_script("arguments[0].value = arguments[1]", password_input, self.o365_password.get())
-            
-            # Click Sign in
-            sign_in_button = driver.find_element(By.ID, "idSIButton9")
-            sign_in_button.click()
-            
-            # Wait for DUO prompt
-            time.sleep(2)
+            # Wait for the DUO prompt to be completed and cache the access token,
+            # stopping early if the credentials were rejected
+            state = self._wait_for_script(driver, O365_LOGIN_STATE_SCRIPT, O365_LOGIN_TIMEOUT)
+            if 'error' in state:
+                raise Exception(f"Sign-in was rejected: {state['error']}")
+            self._save_o365_token(state['token'])
             
             # Store session cookies
             cookies = driver.get_cookies()
-            with open(os.path.join(self.credentials_dir, 'o365_cookies.json'), 'w') as f:
-                json.dump(cookies, f)
+            self._write_credentials_file('o365_cookies.json', cookies)
+            self._o365_cookies = self._make_cookie_jar(cookies)
             
             logger.info("O365 authentication successful")
             return True
             
-        except TimeoutException:
+        except (TimeoutException, ScriptTimeoutException):
             logger.error("O365 authentication timed out")
-            messagebox.showerror("Error", "Authentication timed out. Please try again.")
+            self._show_error("Authentication timed out. Please try again.")
             return False
         except WebDriverException as e:
             logger.error(f"Selenium WebDriver error: {str(e)}")
-            messagebox.showerror("Error", f"Browser automation error: {str(e)}")
+            self._show_error(f"Browser automation error: {str(e)}")
+            # The browser may be unusable after a driver error, start afresh next time
+            self._quit_driver()
             return False
         except Exception as e:
             logger.error(f"Unexpected error during O365 authentication: {str(e)}")
-            messagebox.showerror("Error", f"O365 authentication failed: {str(e)}")
+            self._show_error(f"O365 authentication failed: {str(e)}")
             return False
-        finally:
-            if driver:
-                driver.quit()
+
+    def _read_credentials_file(self, filename):
+        """
+        Read a JSON state file from the credentials directory.
+        
+        Args:
+            filename (str): Name of the file inside the credentials directory
+            
+        Returns:
+            The decoded content, or None if the file is missing or invalid
+        """
+        try:
+            with open(os.path.join(self.credentials_dir, filename), 'rb') as f:
+                return json_loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_credentials_file(self, filename, data):
+        """
+        Write a JSON state file to the credentials directory, readable only by the owner.
+        
+        Args:
+            filename (str): Name of the file inside the credentials directory
+            data: JSON-serializable content
+        """
+        os.makedirs(self.credentials_dir, exist_ok=True)
+        path = os.path.join(self.credentials_dir, filename)
+        with open(path, 'wb') as f:
+            f.write(json_dumps(data))
+        os.chmod(path, 0o600)
+
+    def _load_o365_cookies(self):
+        """
+        Load the O365 session cookies saved by authenticate_o365.
+        
+        The cookie file is read once; later syncs reuse the same jar until
+        authenticate_o365 replaces it.
+        
+        Returns:
+            requests.cookies.RequestsCookieJar: Cookie jar for the Graph session
+            
+        Raises:
+            Exception: If no O365 session has been saved
+        """
+        if self._o365_cookies is None:
+            cookies = self._read_credentials_file('o365_cookies.json')
+            if cookies is None:
+                logger.error("O365 session not found")
+                raise Exception("O365 session not found. Please authenticate first.")
+            self._o365_cookies = self._make_cookie_jar(cookies)
+        return self._o365_cookies
+
+    def _make_cookie_jar(self, cookies):
+        """
+        Build a cookie jar from cookies in the WebDriver get_cookies format.
+        
+        Domain, path, secure flag and expiry are kept so the cookies are only
+        sent where the browser would send them.
+        
+        Args:
+            cookies (list): Cookie dictionaries from the browser session
+            
+        Returns:
+            requests.cookies.RequestsCookieJar: Cookie jar for the Graph session
+        """
+        from requests.cookies import RequestsCookieJar, create_cookie
+
+        jar = RequestsCookieJar()
+        for cookie in cookies:
+            jar.set_cookie(create_cookie(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/'),
+                secure=cookie.get('secure', False),
+                expires=cookie.get('expiry')
+            ))
+        return jar
+
+    def _load_o365_token(self):
+        """
+        Load the cached O365 access token for the current account.
+        
+        With MSAL configured the token comes from the MSAL cache, refreshed
+        silently if needed.
+        
+        Returns:
+            str: Access token, or None if no token is cached or it is about to expire
+        """
+        if self.o365_client_id:
+            return self._acquire_msal_token()
+
+        cached = self._token_cache.get(self._o365_username)
+        if cached is None:
+            cached = (self._read_credentials_file('o365_token.json') or {}).get(self._o365_username)
+            if cached:
+                self._token_cache[self._o365_username] = cached
+
+        if cached and cached['exp'] - time.time() > TOKEN_MIN_TTL:
+            return cached['token']
+        return None
+
+    def _get_o365_token(self):
+        """
+        Return an O365 access token for the sync.
+        
+        The cached token is used when possible. For browser logins, a missing or
+        expiring token is read again from the Outlook web session, which
+        requires starting Chrome.
+        
+        Returns:
+            str: Access token, or None if none is available
+        """
+        token = self._load_o365_token()
+        if token is None and not self.o365_client_id:
+            driver = self._get_driver()
+            driver.get('https://outlook.office365.com')
+            token = self._wait_for_script(driver, ACCESS_TOKEN_SCRIPT, O365_FORM_TIMEOUT)
+            self._save_o365_token(token)
+        return token
+
+    def _save_o365_token(self, token):
+        """
+        Cache an O365 access token and its expiry for the current account.
+        
+        Args:
+            token (str): Access token obtained from the browser session
+        """
+        entry = {'token': token, 'exp': token_expiry(token)}
+        self._token_cache[self._o365_username] = entry
+
+        cache = self._read_credentials_file('o365_token.json') or {}
+        cache[self._o365_username] = entry
+        self._write_credentials_file('o365_token.json', cache)
+        logger.info("O365 access token cached")
 
     def create_event_key(self, event, is_google=True):
         """
-        Create a unique key for an event based on its properties.
+        Create a key identifying an event by its title and start time.
+        
+        Google and O365 assign unrelated event IDs, so the key is built from
+        properties that are copied across during the sync.
         
         Args:
             event (dict): Event data
             is_google (bool): Whether the event is from Google Calendar
             
         Returns:
-            str: Unique event identifier
+            tuple: (subject, normalized start time)
         """
         if is_google:
-            start_time = event['start'].get('dateTime', event['start'].get('date'))
-            event_id = event.get('id', '')
+            subject = event.get('summary', 'No Title')
         else:
-            start_time = event['start'].get('dateTime', event['start'].get('date'))
-            event_id = event.get('id', '')
+            subject = event.get('subject', '')
+        start_time = event['start'].get('dateTime') or event['start'].get('date')
+        
+        return (subject, normalize_datetime(start_time))
+
+    def event_projection(self, event):
+        """
+        Reduce an O365 event to the fields the sync writes, for comparison.
+        
+        Times are normalized to naive UTC, so an event converted from Google
+        compares equal to the same event read back from Graph.
+        
+        Args:
+            event (dict): O365 event data
+            
+        Returns:
+            tuple: (subject, start, end, location display name)
+        """
+        start = event.get('start') or {}
+        end = event.get('end') or {}
+        return (
+            event.get('subject'),
+            normalize_datetime(start.get('dateTime')),
+            normalize_datetime(end.get('dateTime')),
+            (event.get('location') or {}).get('displayName')
+        )
+
+    def to_o365_event(self, event):
+        """
+        Convert a Google Calendar event to an O365 event payload.
+        
+        Args:
+            event (dict): Google Calendar event
+            
+        Returns:
+            dict: Event data in Microsoft Graph format
+        """
+        o365_event = {
+            'subject': event.get('summary', 'No Title'),
+            'start': {
+                'dateTime': event['start'].get('dateTime') or event['start'].get('date'),
+                'timeZone': event['start'].get('timeZone', 'UTC')
+            },
+            'end': {
+                'dateTime': event['end'].get('dateTime') or event['end'].get('date'),
+                'timeZone': event['end'].get('timeZone', 'UTC')
+            }
+        }
+        
+        # Add description if available
+        if 'description' in event:
+            o365_event['body'] = {
+                'contentType': 'text',
+                'content': event['description']
+            }
+        
+        # Add location if available
+        if 'location' in event:
+            o365_event['location'] = {
+                'displayName': event['location']
+            }
         
-        # Create a key that combines multiple identifiers
-        return f"{event_id}_{start_time}"
+        return o365_event
 
-    def get_existing_events(self, session):
+    def get_existing_events(self, session, time_min, time_max):
         """
         Retrieve existing events from O365 calendar with detailed information.
         
+        Events are listed with a calendarView delta query. The resulting events
+        and delta link are stored in credentials/o365_delta.json, so later
+        calls only download the events added, changed or removed since then.
+        A new listing is started when the stored one no longer covers the sync
+        window or its delta link has expired.
+        
         Args:
             session (requests.Session): Authenticated session object
+            time_min (str): Start of the sync window as an ISO 8601 UTC timestamp
+            time_max (str): End of the sync window as an ISO 8601 UTC timestamp
             
         Returns:
-            dict: Dictionary of existing events with composite keys
+            dict: Dictionary of existing events keyed by create_event_key
         """
+        from requests import HTTPError
+
         try:
-            # Get events for the next 30 days
-            now = datetime.utcnow()
-            end_date = (now + timedelta(days=30)).isoformat() + 'Z'
-            now = now.isoformat() + 'Z'
-            
-            response = session.get(
-                'https://graph.microsoft.com/v1.0/me/events',
-                params={
-                    '$select': 'id,subject,start,end,body,location',
-                    '$filter': f"start/dateTime ge '{now}' and start/dateTime le '{end_date}'"
+            state = self._read_credentials_file('o365_delta.json') or {}
+            delta_link = state.get('delta_link')
+            if delta_link and state['time_min'] <= time_min and state['time_max'] >= time_max:
+                try:
+                    events, delta_link = self._fetch_event_delta(session, delta_link)
+                    events = dict(state['events'], **events)
+                except HTTPError as e:
+                    logger.warning(f"O365 delta link expired, listing all events again: {str(e)}")
+                    delta_link = None
+            else:
+                delta_link = None
+
+            if delta_link is None:
+                window_start = datetime.fromisoformat(time_min.replace('Z', '+00:00'))
+                state = {
+                    'time_min': time_min,
+                    'time_max': utc_timestamp(window_start + timedelta(days=GRAPH_DELTA_WINDOW_DAYS))
                 }
-            )
-            response.raise_for_status()
-            
-            events_dict = {}
-            for event in response.json().get('value', []):
-                key = self.create_event_key(event, is_google=False)
-                events_dict[key] = event
-            
+                events, delta_link = self._fetch_event_delta(session, GRAPH_DELTA_URL, {
+                    'startDateTime': state['time_min'],
+                    'endDateTime': state['time_max']
+                })
+
+            # Removed events are reported as None and dropped from the stored copy
+            state['events'] = {event_id: event for event_id, event in events.items() if event is not None}
+            state['delta_link'] = delta_link
+            self._write_credentials_file('o365_delta.json', state)
+
+            events_dict = {
+                self.create_event_key(event, is_google=False): event
+                for event in state['events'].values()
+            }
             logger.info(f"Retrieved {len(events_dict)} existing O365 events")
             return events_dict
         except Exception as e:
             logger.error(f"Error retrieving O365 events: {str(e)}")
             return {}
 
-    def sync_calendars(self, google_service):
+    def _fetch_event_delta(self, session, url, params=None):
         """
-        Synchronize events from Google Calendar to Office 365.
+        Follow a calendarView delta query through all of its result pages.
         
         Args:
-            google_service: Authenticated Google Calendar service
+            session (requests.Session): Authenticated session object
+            url (str): Delta query URL, or a delta link from an earlier query
+            params (dict): Query parameters for the first request, if any
+            
+        Returns:
+            tuple: (events, delta_link) where events maps event IDs to the
+                event data, or to None for events removed from the calendar
+            
+        Raises:
+            requests.HTTPError: If Graph rejects one of the requests
         """
-        try:
-            # Get Gmail calendar events for the next 30 days
-            now = datetime.utcnow()
-            end_date = (now + timedelta(days=30)).isoformat() + 'Z'
-            now = now.isoformat() + 'Z'
+        events = {}
+        headers = {'Prefer': f'{GRAPH_READ_PREFER}, odata.maxpagesize=250'}
+        while True:
+            self._graph_throttle.acquire()
+            response = session.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            page = json_loads(response.content)
             
+            for event in page.get('value', []):
+                if '@removed' in event:
+                    events[event['id']] = None
+                else:
+                    events[event['id']] = {
+                        field: event[field] for field in ('id', 'subject', 'start', 'end', 'location')
+                        if field in event
+                    }
+            
+            # The next and delta links already carry the query parameters
+            params = None
+            url = page.get('@odata.nextLink')
+            if url is None:
+                return events, page.get('@odata.deltaLink')
+
+    def iter_google_event_pages(self, google_service, **params):
+        """
+        Iterate over result pages of the primary Google calendar's event list.
+        
+        Only the fields used by the sync are requested, which keeps responses
+        small.
+        
+        Args:
+            google_service: Authenticated Google Calendar service
+            **params: Additional arguments for events().list()
+            
+        Yields:
+            dict: One page of the event list response
+        """
+        page_token = None
+        while True:
             events_result = google_service.events().list(
                 calendarId='primary',
-                timeMin=now,
-                timeMax=end_date,
                 maxResults=250,
                 singleEvents=True,
-                orderBy='startTime'
+                pageToken=page_token,
+                fields='items(id,status,summary,description,location,start(dateTime,date,timeZone),end(dateTime,date,timeZone)),nextPageToken,nextSyncToken',
+                **params
             ).execute()
-            events = events_result.get('items', [])
+            yield events_result
             
-            if not events:
-                logger.info("No upcoming events found in Google Calendar")
-                return
+            page_token = events_result.get('nextPageToken')
+            if not page_token:
+                break
+
+    def get_google_events(self, google_service, time_min, time_max, sync_token=None, mapped_ids=()):
+        """
+        Retrieve events from the primary Google calendar.
+        
+        With a sync token only the events changed since the token was issued are
+        returned, including cancelled ones. Changed events outside the sync
+        window are left out, since the token covers the whole calendar, unless
+        they already have an O365 counterpart that needs to follow them. If
+        Google has expired the token, all events within the sync window are
+        listed instead.
+        
+        Args:
+            google_service: Authenticated Google Calendar service
+            time_min (str): Start of the sync window as an ISO 8601 UTC timestamp
+            time_max (str): End of the sync window as an ISO 8601 UTC timestamp
+            sync_token (str): Token from a previous listing, if any
+            mapped_ids: Google event IDs that have an O365 counterpart
             
-            # Get authentication token from browser session
-            driver = webdriver.Chrome()
-            try:
-                driver.get('https://outlook.office365.com')
-                token = driver.execute_script('return window.localStorage.getItem("accessToken")')
-            finally:
-                driver.quit()
+        Returns:
+            tuple: (events, next sync token, whether the listing is incremental)
+        """
+        from googleapiclient.errors import HttpError
 
-            # Create session with stored O365 cookies
-            session = requests.Session()
-            try:
-                with open(os.path.join(self.credentials_dir, 'o365_cookies.json'), 'r') as f:
-                    cookies = json.load(f)
-                    for cookie in cookies:
-                        session.cookies.set(cookie['name'], cookie['value'])
-            except FileNotFoundError:
-                logger.error("O365 session not found")
-                raise Exception("O365 session not found. Please authenticate first.")
+        if sync_token:
+            params = {'syncToken': sync_token}
+        else:
+            params = {'timeMin': time_min, 'timeMax': time_max}
+        
+        events = []
+        next_sync_token = None
+        try:
+            for page in self.iter_google_event_pages(google_service, **params):
+                events.extend(page.get('items', []))
+                next_sync_token = page.get('nextSyncToken', next_sync_token)
+        except HttpError as e:
+            if sync_token and e.resp.status == 410:
+                logger.warning("Google sync token expired, performing a full sync")
+                return self.get_google_events(google_service, time_min, time_max)
+            raise
+        
+        if sync_token:
+            events = [
+                event for event in events
+                if event.get('status') == 'cancelled' or event['id'] in mapped_ids or
+                event_in_window(event, time_min, time_max)
+            ]
+        return events, next_sync_token, bool(sync_token)
+
+    def _make_graph_session(self):
+        """
+        Create a requests session tuned for Microsoft Graph.
+        
+        The session keeps connections alive in a pool large enough for the write
+        workers, retries throttled or failed idempotent requests while honoring
+        Retry-After, and asks for gzip-compressed responses. POST is not retried
+        automatically because a failed batch may have been partly applied;
+        _send_events_batch handles throttled batches itself.
+        
+        Returns:
+            requests.Session: Configured session without authorization
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            allowed_methods=['GET', 'PATCH', 'DELETE']
+        )
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries))
+        session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip',
+            'Content-Type': 'application/json',
+            'Prefer': GRAPH_WRITE_PREFER
+        })
+        return session
+
+    def _check_cancelled(self):
+        """
+        Stop the running synchronization if the user has cancelled it.
+        
+        Raises:
+            SyncCancelledError: If cancellation was requested
+        """
+        if self._cancel_event.is_set():
+            raise SyncCancelledError("Sync cancelled by user")
 
-            # Get existing events to check for duplicates
-            existing_events = self.get_existing_events(session)
+    def _upsert_operation(self, google_id, o365_event, existing_event):
+        """
+        Decide whether a Google event has to be created or updated in O365.
+        
+        Args:
+            google_id (str): Google event identifier
+            o365_event (dict): Event data converted from the Google event
+            existing_event (dict): Matching O365 event, or None if there is none
             
-            # Sync events
-            for event in events:
-                event_key = self.create_event_key(event, is_google=True)
-                event_summary = event.get('summary', 'No Title')
-                
-                # Format event data for O365
-                o365_event = {
-                    'subject': event_summary,
-                    'start': {
-                        'dateTime': event['start'].get('dateTime', event['start'].get('date')),
-                        'timeZone': event['start'].get('timeZone', 'UTC')
-                    },
-                    'end': {
-                        'dateTime': event['end'].get('dateTime', event['end'].get('date')),
-                        'timeZone': event['end'].get('timeZone', 'UTC')
-                    }
-                }
-                
-                # Add description if available
-                if 'description' in event:
-                    o365_event['body'] = {
-                        'contentType': 'text',
-                        'content': event['description']
-                    }
-                
-                # Add location if available
-                if 'location' in event:
-                    o365_event['location'] = {
-                        'displayName': event['location']
-                    }
+        Returns:
+            tuple: (google_id, event_id, o365_event) operation for
+                _send_events_batch, or None if the event is unchanged
+        """
+        if existing_event is None:
+            return (google_id, None, o365_event)
 
-                # Create session with token
-                session.headers.update({
-                    'Authorization': f'Bearer {token}',
-                    'Content-Type': 'application/json'
-                })
+        event_summary = o365_event['subject']
+        projection = self.event_projection(o365_event)
+        existing_projection = self.event_projection(existing_event)
+        # A location removed in Google is left in place in O365
+        if projection[3] is None:
+            projection = projection[:3] + existing_projection[3:]
 
-                try:
-                    if event_key in existing_events:
-                        # Event exists - check if it needs updating
-                        existing_event = existing_events[event_key]
-                        needs_update = (
-                            existing_event['subject'] != event_summary or
-                            existing_event['start']['dateTime'] != o365_event['start']['dateTime'] or
-                            existing_event['end']['dateTime'] != o365_event['end']['dateTime'] or
-                            ('location' in o365_event and ('location' not in existing_event or 
-                                existing_event['location']['displayName'] != o365_event['location']['displayName']))
+        if projection == existing_projection:
+            logger.debug(f"Event unchanged, no update needed: {event_summary}")
+            return None
+        return (google_id, existing_event['id'], o365_event)
+
+    def _batch_request(self, request_id, google_id, event_id, o365_event):
+        """
+        Build one JSON batch sub-request for an event write.
+        
+        Creates carry a transactionId derived from the Google event, so Graph
+        does not create a second copy if the same create is sent again.
+        
+        Args:
+            request_id (str): Identifier of the sub-request within the batch
+            google_id (str): Google event identifier
+            event_id (str): O365 event identifier, or None to create the event
+            o365_event (dict): Event data to write, or None to delete the event
+            
+        Returns:
+            dict: Sub-request for the Graph $batch endpoint
+        """
+        request = {
+            'id': request_id,
+            'headers': {'Prefer': GRAPH_WRITE_PREFER}
+        }
+        if event_id is None:
+            request.update(method='POST', url=GRAPH_EVENTS_PATH)
+        elif o365_event is None:
+            request.update(method='DELETE', url=f'{GRAPH_EVENTS_PATH}/{event_id}')
+        else:
+            request.update(method='PATCH', url=f'{GRAPH_EVENTS_PATH}/{event_id}')
+
+        if o365_event is not None:
+            request['headers']['Content-Type'] = 'application/json'
+            request['body'] = o365_event
+        if event_id is None:
+            key = f"{google_id}_{o365_event['start']['dateTime']}"
+            request['body'] = dict(o365_event, transactionId=hashlib.sha256(key.encode('utf-8')).hexdigest()[:36])
+        return request
+
+    def _send_events_batch(self, session, operations):
+        """
+        Create, update and delete Office 365 events with a single Graph JSON batch request.
+        
+        Each operation is a (google_id, event_id, o365_event) tuple: an event_id
+        of None creates the event, an o365_event of None deletes it, and
+        otherwise the event is updated. Requests are paced by the shared token
+        bucket, and requests throttled by Graph (HTTP 429) or rejected as
+        temporarily unavailable (HTTP 503) are retried after the delay given
+        in their Retry-After header. An update of an event that no longer
+        exists in O365 is sent again as a create.
+        
+        Args:
+            session (requests.Session): Authenticated session object
+            operations (list): Up to GRAPH_BATCH_LIMIT event operations
+            
+        Returns:
+            tuple: (changes, rejected) where changes maps google_id to the O365
+                event ID, or to None for deleted events, and rejected is the set
+                of google_ids whose requests Graph refused with a client error
+            
+        Raises:
+            SyncCancelledError: If the sync was cancelled before the batch was sent
+        """
+        pending = {str(i): operation for i, operation in enumerate(operations)}
+        changes = {}
+        rejected = set()
+
+        for attempt in range(GRAPH_MAX_RETRIES + 1):
+            self._graph_throttle.acquire(len(pending))
+            self._check_cancelled()
+            response = session.post(GRAPH_BATCH_URL, data=json_dumps({
+                'requests': [
+                    self._batch_request(request_id, google_id, event_id, o365_event)
+                    for request_id, (google_id, event_id, o365_event) in pending.items()
+                ]
+            }))
+
+            # Creates carry a transactionId, so resending the whole batch is safe
+            if response.status_code in (429, 503):
+                retry_after = retry_after_seconds(response.headers.get('Retry-After'), 2 ** attempt)
+            else:
+                response.raise_for_status()
+                retry_after = 0
+                resend = {}
+                for result in json_loads(response.content).get('responses', []):
+                    request_id = result.get('id')
+                    if request_id not in pending:
+                        continue
+                    google_id, event_id, o365_event = pending[request_id]
+                    description = o365_event['subject'] if o365_event else event_id
+
+                    status = result.get('status', 0)
+                    if status in (429, 503):
+                        resend[request_id] = pending[request_id]
+                        retry_after = max(retry_after, retry_after_seconds(
+                            (result.get('headers') or {}).get('Retry-After'), 2 ** attempt
+                        ))
+                    elif o365_event is None and (200 <= status < 300 or status == 404):
+                        # A 404 means the event was already removed in O365
+                        changes[google_id] = None
+                        logger.info(f"Deleted cancelled event: {description}")
+                    elif status == 404 and event_id is not None:
+                        # The event was deleted in O365, so recreate it
+                        resend[request_id] = (google_id, None, o365_event)
+                        logger.info(f"Event missing in O365, creating it again: {description}")
+                    elif 200 <= status < 300 and event_id is None:
+                        # With return=minimal the new event is only referenced by its Location
+                        changes[google_id] = (
+                            (result.get('body') or {}).get('id') or
+                            event_id_from_location(result.get('headers', {}).get('Location'))
                         )
-                        
-                        if needs_update:
-                            # Update existing event
-                            response = session.patch(
-                                f"https://graph.microsoft.com/v1.0/me/events/{existing_event['id']}",
-                                json=o365_event
-                            )
-                            response.raise_for_status()
-                            logger.info(f"Updated existing event: {event_summary}")
-                        else:
-                            logger.info(f"Event unchanged, no update needed: {event_summary}")
+                        logger.info(f"Created new event: {description}")
+                    elif 200 <= status < 300:
+                        changes[google_id] = event_id
+                        logger.info(f"Updated existing event: {description}")
                     else:
-                        # Create new event
-                        response = session.post(
-                            'https://graph.microsoft.com/v1.0/me/events',
-                            json=o365_event
+                        error = (result.get('body') or {}).get('error', {}).get('message', status)
+                        logger.error(f"Failed to sync event {description}: {error}")
+                        # Client errors will not succeed on a retry
+                        if 400 <= status < 500:
+                            rejected.add(google_id)
+                pending = resend
+
+            if not pending:
+                break
+            if attempt < GRAPH_MAX_RETRIES and retry_after:
+                logger.warning(f"Graph throttled {len(pending)} requests, retrying in {retry_after}s")
+                time.sleep(retry_after)
+        else:
+            for google_id, event_id, o365_event in pending.values():
+                description = o365_event['subject'] if o365_event else event_id
+                logger.error(f"Failed to sync event {description}: rate limit exceeded")
+
+        return changes, rejected
+
+    def sync_calendars(self, google_service):
+        """
+        Synchronize events from Google Calendar to Office 365.
+        
+        The first sync of each day lists the next 30 days of Google events and
+        matches them against the O365 calendar. Later syncs on the same day use
+        the stored Google sync token to process only events changed since then,
+        using the stored Google-to-O365 event ID map to update or delete their
+        counterparts. The daily full listing picks up events that have moved
+        into the window without being changed, and removes the O365 copies of
+        mapped events in the window that Google no longer lists.
+        
+        Args:
+            google_service: Authenticated Google Calendar service
+        """
+        try:
+            # Sync events for the next 30 days
+            now = datetime.now(timezone.utc)
+            window_start = now.date().isoformat()
+            end_date = utc_timestamp(now + timedelta(days=30))
+            now = utc_timestamp(now)
+
+            # The sync token is only reused on the day its window was listed
+            sync_state = self._read_credentials_file('gmail_sync_token.json') or {}
+            sync_token = None
+            if sync_state.get('window_start') == window_start:
+                sync_token = sync_state.get('sync_token')
+            elif sync_state.get('sync_token'):
+                logger.info("Sync window has moved, performing a full sync")
+            event_map = self._read_credentials_file('o365_event_map.json') or {}
+
+            # Incremental listings are usually small or empty, so they are fetched
+            # first and the O365 side is skipped entirely when nothing changed
+            google_future = None
+            incremental = False
+            if sync_token:
+                # Mapped events moved out of the window are still updated in O365
+                events, next_sync_token, incremental = self.get_google_events(
+                    google_service, now, end_date, sync_token, mapped_ids=event_map
+                )
+                if incremental and not events:
+                    logger.info("No changes in Google Calendar since the last sync")
+                    if next_sync_token:
+                        self._write_credentials_file('gmail_sync_token.json', {
+                            'sync_token': next_sync_token,
+                            'window_start': window_start
+                        })
+                    return
+
+            # Fetch Google events in the background while the O365 side is prepared
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                if not sync_token:
+                    google_future = executor.submit(self.get_google_events, google_service, now, end_date)
+
+                token = self._get_o365_token()
+                if token is None:
+                    raise Exception("O365 token not available. Please authenticate first.")
+
+                # Create session, with the stored O365 cookies for browser logins
+                session = self._make_graph_session()
+                if not self.o365_client_id:
+                    session.cookies = self._load_o365_cookies()
+
+                session.headers['Authorization'] = f'Bearer {token}'
+
+                # A full sync needs the existing events to avoid creating duplicates
+                if incremental and google_future is None:
+                    existing_events = {}
+                else:
+                    existing_events = self.get_existing_events(session, now, end_date)
+
+                if google_future is not None:
+                    events, next_sync_token, incremental = google_future.result()
+
+            if not events:
+                logger.info("No new or changed events found in Google Calendar")
+            
+            # Cancelled events only need their O365 counterpart removed
+            deleted_events = [
+                (event['id'], event_map[event['id']], None) for event in events
+                if event.get('status') == 'cancelled' and event['id'] in event_map
+            ]
+
+            # Convert all remaining events up front; writes are sent concurrently afterwards
+            payloads = [
+                (event, self.to_o365_event(event)) for event in events
+                if event.get('status') != 'cancelled'
+            ]
+
+            existing_by_id = {event['id']: event for event in existing_events.values()}
+            upserts = []
+            for event, o365_event in payloads:
+                o365_id = event_map.get(event['id'])
+
+                # Changes from an incremental listing are applied to the mapped event
+                if incremental and o365_id:
+                    upserts.append((event['id'], o365_id, o365_event))
+                    continue
+
+                existing_event = (
+                    existing_by_id.get(o365_id) or
+                    existing_events.get(self.create_event_key(event, is_google=True))
+                )
+                if existing_event is not None:
+                    event_map[event['id']] = existing_event['id']
+
+                operation = self._upsert_operation(event['id'], o365_event, existing_event)
+                if operation is not None:
+                    upserts.append(operation)
+
+            # A full listing does not report deleted events, so mapped O365 events
+            # in the window whose Google event is no longer listed are removed
+            if not incremental:
+                listed = {event['id'] for event in events}
+                for google_id, o365_id in event_map.items():
+                    existing_event = existing_by_id.get(o365_id)
+                    if (google_id not in listed and existing_event is not None and
+                            event_in_window(existing_event, now, end_date)):
+                        deleted_events.append((google_id, o365_id, None))
+
+            self._check_cancelled()
+
+            # Send updates, deletes and creates together in Graph JSON batches
+            failed = False
+            with ThreadPoolExecutor(max_workers=GRAPH_MAX_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._send_events_batch, session, batch): batch
+                    for batch in chunked(upserts + deleted_events, GRAPH_BATCH_LIMIT)
+                }
+
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    try:
+                        changes, rejected = future.result()
+                    except (SyncCancelledError, CancelledError):
+                        # Drop the writes that have not started yet; those
+                        # surface here as CancelledError
+                        for other in futures:
+                            other.cancel()
+                        failed = True
+                        continue
+                    except Exception as e:
+                        logger.error(f"Failed to sync batch of {len(batch)} events: {str(e)}")
+                        failed = True
+                        continue
+
+                    for google_id, event_id in changes.items():
+                        if event_id is None:
+                            event_map.pop(google_id, None)
+                        else:
+                            event_map[google_id] = event_id
+                    if rejected:
+                        logger.warning(
+                            f"Skipping {len(rejected)} events rejected by Graph; "
+                            "they are retried when they change in Google"
                         )
-                        response.raise_for_status()
-                        logger.info(f"Created new event: {event_summary}")
-                except Exception as e:
-                    logger.error(f"Failed to sync event {event_summary}: {str(e)}")
+                    failed = failed or len(changes) + len(rejected) < len(batch)
+
+            self._write_credentials_file('o365_event_map.json', event_map)
+            self._check_cancelled()
 
+            # Only advance the sync token once every change has been applied,
+            # so failed events are retried on the next sync
+            if failed:
+                logger.warning("Some events failed to sync and will be retried next time")
+            elif next_sync_token:
+                self._write_credentials_file('gmail_sync_token.json', {
+                    'sync_token': next_sync_token,
+                    'window_start': window_start
+                })
+
+        except SyncCancelledError:
+            raise
         except Exception as e:
             logger.error(f"Error during calendar sync: {str(e)}")
             raise
 
     def save_credentials(self):
         """Save user credentials securely using keyring."""
+        import keyring
+
         try:
-            keyring.set_password("calendar_sync", "gmail_email", self.gmail_email.get())
-            keyring.set_password("calendar_sync", "o365_email", self.o365_email.get())
+            gmail_email = self.gmail_email.get()
+            o365_email = self.o365_email.get()
+            keyring.set_password("calendar_sync", "gmail_email", gmail_email)
+            keyring.set_password("calendar_sync", "o365_email", o365_email)
+            self._saved_credentials = (gmail_email, o365_email)
             logger.info("Credentials saved successfully")
             self.status_label.config(text="Credentials saved successfully!")
         except Exception as e:
             logger.error(f"Error saving credentials: {str(e)}")
             self.status_label.config(text="Error saving credentials!")
 
+    def _set_status(self, text):
+        """
+        Update the status label from any thread.
+        
+        Args:
+            text (str): Status message to display
+        """
+        self.root.after(0, self.status_label.config, {'text': text})
+
+    def _show_error(self, message):
+        """
+        Show an error dialog from any thread.
+        
+        Args:
+            message (str): Error message to display
+        """
+        self.root.after(0, messagebox.showerror, "Error", message)
+
     def start_sync(self):
-        """Start the calendar synchronization process."""
+        """Start the calendar synchronization process in a background thread."""
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            return
+
+        # Tk widgets may only be read from the main thread
+        self._o365_username = self.o365_email.get()
+        self._o365_password = self.o365_password.get()
+
+        self._cancel_event.clear()
+        self.start_button.config(state=tk.DISABLED)
+        self.progress.start()
+        self._sync_thread = threading.Thread(target=self._do_sync, daemon=True)
+        self._sync_thread.start()
+
+    def cancel_sync(self):
+        """Request cancellation of the running synchronization."""
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            self._cancel_event.set()
+            logger.info("Sync cancellation requested")
+            self.status_label.config(text="Cancelling sync...")
+
+    def _do_sync(self):
+        """Run the calendar synchronization; executed on the sync thread."""
         try:
-            self.status_label.config(text="Starting sync process...")
+            self._set_status("Starting sync process...")
             logger.info("Starting calendar sync")
             
             # Authenticate with Google
             google_service = self.authenticate_google()
+            self._check_cancelled()
             
-            # Authenticate with O365
-            if self.authenticate_o365():
+            # Authenticate with O365 unless a cached token is still valid
+            if self._load_o365_token() or self.authenticate_o365():
                 # Perform the sync
                 self.sync_calendars(google_service)
                 logger.info("Sync completed successfully")
-                self.status_label.config(text="Sync completed successfully!")
+                self._set_status("Sync completed successfully!")
             else:
                 logger.error("O365 authentication failed")
-                self.status_label.config(text="O365 authentication failed")
+                self._set_status("O365 authentication failed")
                 
+        except SyncCancelledError:
+            logger.info("Sync cancelled")
+            self._set_status("Sync cancelled")
         except Exception as e:
             logger.error(f"Sync error: {str(e)}")
-            self.status_label.config(text=f"Error: {str(e)}")
+            self._set_status(f"Error: {str(e)}")
+        finally:
+            # The access token is cached, so Chrome is not needed until it expires
+            self._quit_driver()
+            self.root.after(0, self._finish_sync)
+
+    def _finish_sync(self):
+        """Reset the GUI once the sync thread has finished."""
+        self.progress.stop()
+        self.start_button.config(state=tk.NORMAL)
 
     def run(self):
         """Start the Calendar Sync application."""
         logger.info("Starting Calendar Sync application")
         self.setup_gui()
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._save_msal_cache()
+            self._quit_driver()
+            log_listener.stop()
 
 if __name__ == "__main__":
     app = CalendarSync()